@@ -9,13 +9,21 @@ License: MIT
 import streamlit as st
 import sqlite3
 import uuid
+import hashlib
+import hmac
+import io
 import json
 import logging
+import re
+import sys
+import threading
+from bisect import insort
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime
 from contextlib import contextmanager
-from dataclasses import dataclass, field, asdict
-from typing import Optional, Dict, List, Any
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Iterator, List, Any
 import os
 
 # Optional import with fallback
@@ -53,6 +61,11 @@ DB_FILE = os.environ.get("PROMPT_DB_FILE", "prompts.db")
 AUTH_USERNAME = os.environ.get("USERNAME", "admin")
 AUTH_PASSWORD = os.environ.get("PASSWORD", "admin")
 
+# Prehashed credentials: fixed-length digests let check_login compare in
+# constant time regardless of input length
+_AUTH_USER_HASH = hashlib.sha256(AUTH_USERNAME.encode()).digest()
+_AUTH_PASS_HASH = hashlib.sha256(AUTH_PASSWORD.encode()).digest()
+
 
 # =============================================================================
 # TAG SYSTEM CONFIGURATION v2.0
@@ -475,6 +488,11 @@ TAG_CATEGORIES = {
     ],
 }
 
+# Derived lookup structures: frozensets give O(1) membership tests and the
+# category-name tuple avoids rebuilding list(TAG_CATEGORIES.keys())
+TAG_CATEGORY_SETS = {category: frozenset(tags) for category, tags in TAG_CATEGORIES.items()}
+ALL_CATEGORY_NAMES = tuple(TAG_CATEGORIES)
+
 # Validation rules
 REQUIRED_TAGS = ["Task Type", "Complexity", "Abstraction Level"]
 SINGLE_VALUE_CATEGORIES = ["Complexity", "Abstraction Level", "Status"]
@@ -484,7 +502,22 @@ SINGLE_VALUE_CATEGORIES = ["Complexity", "Abstraction Level", "Status"]
 # DATA MODELS
 # =============================================================================
 
-@dataclass
+# Widget-key prefixes a library card needs, in render order
+_WIDGET_KEY_PREFIXES = (
+    'open', 'copy', 'copy_btn', 'fav', 'edit', 'dup', 'confirm', 'delete'
+)
+
+# Section order for structured-prompt clipboard text
+_COPY_SECTIONS = (
+    ("PERSONA", "persona"),
+    ("CONTEXT", "context"),
+    ("TASK", "task"),
+    ("STYLE", "style"),
+    ("VARIABLES", "variables"),
+)
+
+
+@dataclass(slots=True)
 class Prompt:
     """Data model for a prompt."""
     id: str
@@ -504,13 +537,22 @@ class Prompt:
     created_at: str = ""
     last_modified: str = ""
     tags: Dict[str, List[str]] = field(default_factory=dict)
+    # Lazily-built cache, not part of the prompt's data (slots=True rules
+    # out functools.cached_property, so the memo lives in its own slot)
+    _widget_keys: Optional[Dict[str, str]] = field(
+        default=None, repr=False, compare=False
+    )
+    _copy_text: Optional[str] = field(default=None, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Prompt":
         """Create Prompt from dictionary."""
         tags = data.pop("tags", {})
-        # Filter out keys not in dataclass
-        valid_keys = {f.name for f in cls.__dataclass_fields__.values()}
+        # Filter out keys not in dataclass (and internal caches)
+        valid_keys = {
+            f.name for f in cls.__dataclass_fields__.values()
+            if not f.name.startswith('_')
+        }
         filtered_data = {k: v for k, v in data.items() if k in valid_keys}
         prompt = cls(**filtered_data)
         prompt.tags = tags
@@ -518,45 +560,91 @@ class Prompt:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        # asdict() deep-copies every field; a shallow copy plus fresh tag
+        # lists is all callers need and is far cheaper on the export path
+        data = {
+            name: getattr(self, name)
+            for name in self.__dataclass_fields__
+            if not name.startswith('_')
+        }
+        data['tags'] = {k: list(v) for k, v in self.tags.items()}
+        return data
+
+    @property
+    def widget_keys(self) -> Dict[str, str]:
+        """Per-card widget keys, interned and built once per instance."""
+        if self._widget_keys is None:
+            self._widget_keys = {
+                prefix: sys.intern(f"{prefix}_{self.id}")
+                for prefix in _WIDGET_KEY_PREFIXES
+            }
+        return self._widget_keys
+
+    @property
+    def copy_text(self) -> str:
+        """Text for clipboard copy, stitched together once per instance."""
+        if self._copy_text is None:
+            self._copy_text = self.get_copy_text()
+        return self._copy_text
 
     def get_copy_text(self) -> str:
         """Generate text for clipboard copy."""
         if self.prompt_type == "standard":
             return self.instructions or ""
-        
-        parts = []
-        if self.persona:
-            parts.append(f"### PERSONA\n{self.persona}")
-        if self.context:
-            parts.append(f"### CONTEXT\n{self.context}")
-        if self.task:
-            parts.append(f"### TASK\n{self.task}")
-        if self.style:
-            parts.append(f"### STYLE\n{self.style}")
-        if self.variables:
-            parts.append(f"### VARIABLES\n{self.variables}")
-        return "\n\n---\n\n".join(parts)
+
+        return "\n\n---\n\n".join(
+            f"### {label}\n{value}"
+            for label, attr in _COPY_SECTIONS
+            if (value := getattr(self, attr))
+        )
 
 
 # =============================================================================
 # DATABASE LAYER
 # =============================================================================
 
+@st.cache_resource(show_spinner=False)
+def _get_conn() -> sqlite3.Connection:
+    """Open and configure the shared SQLite connection (one per server process)."""
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    # WAL + synchronous=NORMAL cuts the per-commit fsync cost for the many
+    # short write transactions; foreign_keys is off by default in SQLite and
+    # must be enabled for ON DELETE CASCADE to fire
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    conn.execute("PRAGMA mmap_size=134217728")
+    return conn
+
+
+# Serializes transaction scopes on the shared connection: Streamlit runs one
+# thread per session, and interleaved BEGIN/COMMIT pairs from concurrent
+# sessions would error out or commit each other's half-finished writes
+_db_lock = threading.Lock()
+
+
 @contextmanager
 def get_db_connection():
-    """Context manager for database connections."""
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-        conn.commit()
-    except Exception as e:
-        conn.rollback()
-        logger.error(f"Database error: {e}")
-        raise
-    finally:
-        conn.close()
+    """Context manager wrapping the shared connection in an explicit transaction."""
+    conn = _get_conn()
+    with _db_lock:
+        conn.execute("BEGIN")
+        committed = False
+        try:
+            yield conn
+            conn.execute("COMMIT")
+            committed = True
+        except Exception as e:
+            logger.error(f"Database error: {e}")
+            raise
+        finally:
+            # finally (not except) so an abandoned generator's GeneratorExit
+            # also rolls back instead of wedging the connection mid-transaction
+            if not committed:
+                conn.execute("ROLLBACK")
 
 
 def init_db():
@@ -582,9 +670,31 @@ def init_db():
                 context TEXT DEFAULT '',
                 task TEXT DEFAULT '',
                 style TEXT DEFAULT '',
-                variables TEXT DEFAULT ''
+                variables TEXT DEFAULT '',
+                tags_json TEXT DEFAULT '{}'
             )
         """)
+
+        # Migration: databases created before the denormalised tags_json
+        # column need it added and backfilled from the normalised tables
+        columns = {row['name'] for row in c.execute("PRAGMA table_info(prompts)")}
+        if 'tags_json' not in columns:
+            c.execute("ALTER TABLE prompts ADD COLUMN tags_json TEXT DEFAULT '{}'")
+            tag_rows = c.execute("""
+                SELECT pt.prompt_id, t.category, t.name FROM tags t
+                JOIN prompt_tags pt ON t.id = pt.tag_id
+            """).fetchall()
+            tags_by_prompt = defaultdict(lambda: defaultdict(list))
+            for tag in tag_rows:
+                tags_by_prompt[tag['prompt_id']][tag['category']].append(tag['name'])
+            c.executemany(
+                "UPDATE prompts SET tags_json = ? WHERE id = ?",
+                [
+                    (json.dumps(tags, separators=(',', ':')), prompt_id)
+                    for prompt_id, tags in tags_by_prompt.items()
+                ]
+            )
+            logger.info("Backfilled tags_json for existing prompts")
         
         # Tags table
         c.execute("""
@@ -607,45 +717,60 @@ def init_db():
             )
         """)
         
+        # Search runs against the cached in-memory index, so a briefly-shipped
+        # FTS5 mirror only taxed every write; drop it where it exists
+        c.execute("DROP TRIGGER IF EXISTS prompts_fts_ai")
+        c.execute("DROP TRIGGER IF EXISTS prompts_fts_ad")
+        c.execute("DROP TRIGGER IF EXISTS prompts_fts_au")
+        c.execute("DROP TABLE IF EXISTS prompts_fts")
+
         # Create indexes for better performance
         c.execute("CREATE INDEX IF NOT EXISTS idx_prompts_title ON prompts(title)")
-        c.execute("CREATE INDEX IF NOT EXISTS idx_prompts_favorite ON prompts(is_favorite)")
-        c.execute("CREATE INDEX IF NOT EXISTS idx_tags_category ON tags(category)")
+        # Partial index: only favourites are ever queried by this flag, so
+        # indexing the 0-rows just bloats the index and slows writes; title is
+        # included so the favourites listing needs no separate sort step
+        c.execute("DROP INDEX IF EXISTS idx_prompts_favorite")
+        c.execute("""
+            CREATE INDEX IF NOT EXISTS idx_prompts_favorite_title
+            ON prompts(is_favorite, title) WHERE is_favorite = 1
+        """)
+        # prompt_tags(prompt_id) is covered by the primary key; tag_id needs its
+        # own index for the tags-side JOIN and the ON DELETE CASCADE lookups
+        c.execute("CREATE INDEX IF NOT EXISTS idx_prompt_tags_tag ON prompt_tags(tag_id)")
+        # Composite index covers both the category scans and (name, category) lookups
+        c.execute("DROP INDEX IF EXISTS idx_tags_category")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_tags_name_category ON tags(category, name)")
         
         logger.info("Database initialized successfully")
 
 
+@st.cache_resource(show_spinner=False)
+def _ensure_db() -> bool:
+    """Run init_db exactly once per server process instead of every rerun."""
+    init_db()
+    return True
+
+
 class PromptRepository:
     """Repository pattern for prompt data access."""
 
     @staticmethod
-    def get_all() -> List[Prompt]:
-        """Load all prompts with their tags."""
+    def iter_all() -> Iterator[Prompt]:
+        """Yield all prompts with their tags, one at a time."""
         with get_db_connection() as conn:
             c = conn.cursor()
-            rows = c.execute("SELECT * FROM prompts ORDER BY title").fetchall()
-            
-            prompts = []
-            for row in rows:
+            # The denormalised tags_json column makes this a join-free
+            # single-table scan: one JSON parse per row
+            for row in c.execute("SELECT * FROM prompts ORDER BY title"):
                 prompt_dict = dict(row)
-                
-                # Load tags
-                tags = c.execute("""
-                    SELECT t.name, t.category FROM tags t
-                    JOIN prompt_tags pt ON t.id = pt.tag_id
-                    WHERE pt.prompt_id = ?
-                """, (prompt_dict['id'],)).fetchall()
-                
-                prompt_dict['tags'] = {}
-                for tag in tags:
-                    category = tag['category']
-                    if category not in prompt_dict['tags']:
-                        prompt_dict['tags'][category] = []
-                    prompt_dict['tags'][category].append(tag['name'])
-                
-                prompts.append(Prompt.from_dict(prompt_dict))
-            
-            return prompts
+                tags_json = prompt_dict.pop('tags_json', None)
+                prompt_dict['tags'] = json.loads(tags_json) if tags_json else {}
+                yield Prompt.from_dict(prompt_dict)
+
+    @staticmethod
+    def get_all() -> List[Prompt]:
+        """Load all prompts with their tags."""
+        return list(PromptRepository.iter_all())
 
     @staticmethod
     def get_by_id(prompt_id: str) -> Optional[Prompt]:
@@ -656,82 +781,99 @@ class PromptRepository:
             
             if not row:
                 return None
-            
+
             prompt_dict = dict(row)
-            
-            # Load tags
-            tags = c.execute("""
-                SELECT t.name, t.category FROM tags t
-                JOIN prompt_tags pt ON t.id = pt.tag_id
-                WHERE pt.prompt_id = ?
-            """, (prompt_dict['id'],)).fetchall()
-            
-            prompt_dict['tags'] = {}
-            for tag in tags:
-                category = tag['category']
-                if category not in prompt_dict['tags']:
-                    prompt_dict['tags'][category] = []
-                prompt_dict['tags'][category].append(tag['name'])
-            
+            tags_json = prompt_dict.pop('tags_json', None)
+            prompt_dict['tags'] = json.loads(tags_json) if tags_json else {}
+
             return Prompt.from_dict(prompt_dict)
 
+    @staticmethod
+    def _replace_tags(c: sqlite3.Cursor, tag_links: List[tuple]) -> None:
+        """Replace tag links for (prompt_id, tags_data) pairs on an existing cursor.
+
+        Batched: two executemany calls plus one bulk SELECT for the tag ids.
+        """
+        c.executemany(
+            "DELETE FROM prompt_tags WHERE prompt_id = ?",
+            [(prompt_id,) for prompt_id, _ in tag_links]
+        )
+
+        pairs = sorted({
+            (tag_name, category)
+            for _, tags_data in tag_links
+            for category, tags in tags_data.items()
+            for tag_name in tags
+        })
+        if not pairs:
+            return
+
+        # Upsert and recover ids in one statement via RETURNING (the no-op
+        # DO UPDATE makes conflicting rows return their id too), chunked to
+        # stay well under SQLite's variable limit
+        id_map = {}
+        for start in range(0, len(pairs), 400):
+            chunk = pairs[start:start + 400]
+            placeholders = ",".join("(?, ?)" for _ in chunk)
+            id_rows = c.execute(
+                f"INSERT INTO tags (name, category) VALUES {placeholders} "
+                f"ON CONFLICT(name, category) DO UPDATE SET name=name "
+                f"RETURNING id, name, category",
+                [value for pair in chunk for value in pair]
+            ).fetchall()
+            id_map.update({(row['name'], row['category']): row['id'] for row in id_rows})
+
+        c.executemany(
+            "INSERT INTO prompt_tags (prompt_id, tag_id) VALUES (?, ?)",
+            [
+                (prompt_id, id_map[(tag_name, category)])
+                for prompt_id, tags_data in tag_links
+                for category, tags in tags_data.items()
+                for tag_name in tags
+            ]
+        )
+
+    @staticmethod
+    def _save_core(c: sqlite3.Cursor, prompt: Prompt, tags_data: Dict[str, List[str]],
+                   current_time: str) -> None:
+        """Write a single prompt and its tags using an existing cursor."""
+        # Single-statement UPSERT: created_at and is_favorite are preserved on
+        # conflict by leaving them out of the DO UPDATE SET clause. tags_json
+        # is the denormalised copy of tags_data kept for join-free listing
+        # reads; the tags/prompt_tags tables stay authoritative for filtering.
+        c.execute("""
+            INSERT INTO prompts (
+                id, title, use_case, description, usage_notes, version,
+                persona, context, task, style, variables, prompt_type,
+                instructions, is_favorite, created_at, last_modified, tags_json
+            ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+            ON CONFLICT(id) DO UPDATE SET
+                title=excluded.title, use_case=excluded.use_case,
+                description=excluded.description, usage_notes=excluded.usage_notes,
+                version=excluded.version, persona=excluded.persona,
+                context=excluded.context, task=excluded.task,
+                style=excluded.style, variables=excluded.variables,
+                prompt_type=excluded.prompt_type, instructions=excluded.instructions,
+                last_modified=excluded.last_modified, tags_json=excluded.tags_json
+        """, (
+            prompt.id, prompt.title, prompt.use_case, prompt.description,
+            prompt.usage_notes, prompt.version, prompt.persona, prompt.context,
+            prompt.task, prompt.style, prompt.variables, prompt.prompt_type,
+            prompt.instructions, 0, current_time, current_time,
+            json.dumps(tags_data, separators=(',', ':'))
+        ))
+        logger.info(f"Saved prompt: {prompt.title}")
+
+        PromptRepository._replace_tags(c, [(prompt.id, tags_data)])
+
     @staticmethod
     def save(prompt: Prompt, tags_data: Dict[str, List[str]]) -> None:
         """Save or update a prompt with tags."""
         with get_db_connection() as conn:
             c = conn.cursor()
-            
             current_time = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
-            
-            # Check if exists
-            exists = c.execute("SELECT id FROM prompts WHERE id = ?", (prompt.id,)).fetchone()
-            
-            if exists:
-                c.execute("""
-                    UPDATE prompts SET 
-                        title=?, use_case=?, description=?, usage_notes=?, version=?,
-                        persona=?, context=?, task=?, style=?, variables=?,
-                        prompt_type=?, instructions=?, last_modified=?
-                    WHERE id=?
-                """, (
-                    prompt.title, prompt.use_case, prompt.description, prompt.usage_notes,
-                    prompt.version, prompt.persona, prompt.context, prompt.task,
-                    prompt.style, prompt.variables, prompt.prompt_type, prompt.instructions,
-                    current_time, prompt.id
-                ))
-                logger.info(f"Updated prompt: {prompt.title}")
-            else:
-                c.execute("""
-                    INSERT INTO prompts (
-                        id, title, use_case, description, usage_notes, version,
-                        persona, context, task, style, variables, prompt_type,
-                        instructions, is_favorite, created_at, last_modified
-                    ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                """, (
-                    prompt.id, prompt.title, prompt.use_case, prompt.description,
-                    prompt.usage_notes, prompt.version, prompt.persona, prompt.context,
-                    prompt.task, prompt.style, prompt.variables, prompt.prompt_type,
-                    prompt.instructions, 0, current_time, current_time
-                ))
-                logger.info(f"Created prompt: {prompt.title}")
-            
-            # Update tags
-            c.execute("DELETE FROM prompt_tags WHERE prompt_id = ?", (prompt.id,))
-            
-            for category, tags in tags_data.items():
-                for tag_name in tags:
-                    c.execute(
-                        "INSERT OR IGNORE INTO tags (name, category) VALUES (?, ?)",
-                        (tag_name, category)
-                    )
-                    tag_id = c.execute(
-                        "SELECT id FROM tags WHERE name = ? AND category = ?",
-                        (tag_name, category)
-                    ).fetchone()[0]
-                    c.execute(
-                        "INSERT INTO prompt_tags (prompt_id, tag_id) VALUES (?, ?)",
-                        (prompt.id, tag_id)
-                    )
+            PromptRepository._save_core(c, prompt, tags_data, current_time)
+        _bump_data_version()
 
     @staticmethod
     def delete(prompt_id: str) -> bool:
@@ -741,7 +883,8 @@ class PromptRepository:
             c.execute("DELETE FROM prompt_tags WHERE prompt_id = ?", (prompt_id,))
             c.execute("DELETE FROM prompts WHERE id = ?", (prompt_id,))
             logger.info(f"Deleted prompt: {prompt_id}")
-            return True
+        _bump_data_version()
+        return True
 
     @staticmethod
     def toggle_favorite(prompt_id: str, current_status: int) -> None:
@@ -753,6 +896,7 @@ class PromptRepository:
                 "UPDATE prompts SET is_favorite = ? WHERE id = ?",
                 (new_status, prompt_id)
             )
+        _bump_data_version()
 
     @staticmethod
     def duplicate(prompt_id: str) -> Optional[str]:
@@ -774,27 +918,71 @@ class PromptRepository:
 
     @staticmethod
     def export_all() -> str:
-        """Export all prompts as JSON."""
-        prompts = PromptRepository.get_all()
-        data = [p.to_dict() for p in prompts]
-        return json.dumps(data, indent=2)
+        """Export all prompts as JSON, serializing one prompt at a time."""
+        buf = io.StringIO()
+        buf.write('[')
+        first = True
+        for prompt in PromptRepository.iter_all():
+            if not first:
+                buf.write(',\n')
+            json.dump(prompt.to_dict(), buf)
+            first = False
+        buf.write(']')
+        return buf.getvalue()
 
     @staticmethod
     def import_from_json(json_str: str) -> int:
-        """Import prompts from JSON. Returns count of imported prompts."""
+        """Import prompts from JSON in one bulk transaction. Returns count imported."""
         data = json.loads(json_str)
-        count = 0
-        
-        for item in data:
-            tags = item.pop('tags', {})
-            # Generate new ID to avoid conflicts
-            item['id'] = str(uuid.uuid4())
-            prompt = Prompt.from_dict(item)
-            PromptRepository.save(prompt, tags)
-            count += 1
-        
-        logger.info(f"Imported {count} prompts")
-        return count
+        current_time = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
+        tag_links: List[tuple] = []
+
+        def _iter_rows() -> Iterator[tuple]:
+            # executemany accepts any iterable: streaming parameter tuples
+            # keeps only one prompt body resident at a time
+            for item in data:
+                tags = item.pop('tags', {})
+                # Generate new ID to avoid conflicts
+                item['id'] = str(uuid.uuid4())
+                prompt = Prompt.from_dict(item)
+                tag_links.append((prompt.id, tags))
+                yield (
+                    prompt.id, prompt.title, prompt.use_case, prompt.description,
+                    prompt.usage_notes, prompt.version, prompt.persona, prompt.context,
+                    prompt.task, prompt.style, prompt.variables, prompt.prompt_type,
+                    prompt.instructions, 0, current_time, current_time,
+                    json.dumps(tags, separators=(',', ':'))
+                )
+
+        with get_db_connection() as conn:
+            c = conn.cursor()
+            c.executemany("""
+                INSERT INTO prompts (
+                    id, title, use_case, description, usage_notes, version,
+                    persona, context, task, style, variables, prompt_type,
+                    instructions, is_favorite, created_at, last_modified, tags_json
+                ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+            """, _iter_rows())
+            PromptRepository._replace_tags(c, tag_links)
+
+        _bump_data_version()
+        logger.info(f"Imported {len(tag_links)} prompts")
+        return len(tag_links)
+
+
+# Module-level bindings of the repository API. The staticmethods resolve to
+# plain functions, so binding them once here lets call sites skip the
+# class-attribute lookup on every invocation; PromptRepository remains the
+# canonical namespace.
+get_prompts = PromptRepository.get_all
+iter_prompts = PromptRepository.iter_all
+get_prompt = PromptRepository.get_by_id
+save_prompt = PromptRepository.save
+delete_prompt = PromptRepository.delete
+toggle_favorite = PromptRepository.toggle_favorite
+duplicate_prompt = PromptRepository.duplicate
+export_prompts = PromptRepository.export_all
+import_prompts = PromptRepository.import_from_json
 
 
 def get_all_tags_by_category() -> Dict[str, List[str]]:
@@ -803,21 +991,127 @@ def get_all_tags_by_category() -> Dict[str, List[str]]:
     
     with get_db_connection() as conn:
         c = conn.cursor()
-        db_tags = c.execute("SELECT name, category FROM tags ORDER BY name").fetchall()
-        
+        db_tags = c.execute("SELECT name, category FROM tags ORDER BY category, name").fetchall()
+
+        # The preset lists are already alphabetical, so inserting custom DB
+        # tags in place keeps every list sorted without a full re-sort pass.
+        # Complexity keeps its hierarchical order and is never merged.
         for tag in db_tags:
             name, category = tag['name'], tag['category']
-            if category in categorized_tags and name not in categorized_tags[category]:
-                categorized_tags[category].append(name)
-    
-    # Sort all tag lists
-    for category in categorized_tags:
-        if category != "Complexity":  # Keep Complexity in hierarchical order
-            categorized_tags[category].sort()
-    
+            if (category in categorized_tags and category != "Complexity"
+                    and name not in TAG_CATEGORY_SETS[category]):
+                insort(categorized_tags[category], name)
+
     return categorized_tags
 
 
+# =============================================================================
+# CACHED DATA ACCESS
+# =============================================================================
+
+def _data_version() -> int:
+    """Current data version used to key the read caches."""
+    return st.session_state.get('data_version', 0)
+
+
+def _bump_data_version() -> None:
+    """Invalidate the cached read paths after a mutation."""
+    st.session_state['data_version'] = st.session_state.get('data_version', 0) + 1
+
+
+@st.cache_data(show_spinner=False, ttl=300)
+def cached_get_all(version: int) -> List[Prompt]:
+    """Version-keyed cache over PromptRepository.get_all."""
+    return get_prompts()
+
+
+@st.cache_data(show_spinner=False, ttl=300)
+def cached_tags_by_category(version: int) -> Dict[str, List[str]]:
+    """Version-keyed cache over get_all_tags_by_category."""
+    return get_all_tags_by_category()
+
+
+@st.cache_data(show_spinner=False, ttl=60)
+def cached_export_bytes(version: int) -> bytes:
+    """UTF-8 JSON export of the whole library, serialized at most once per
+    data version so sidebar reruns don't rebuild it."""
+    return export_prompts().encode('utf-8')
+
+
+# Fields searched by the library page, in haystack order
+_SEARCH_FIELDS = ('title', 'use_case', 'description', 'instructions', 'task',
+                  'persona', 'context')
+_TOKEN_RE = re.compile(r"\W+")
+
+
+@st.cache_data(show_spinner=False, ttl=300)
+def _library_index(version: int) -> Dict[str, Any]:
+    """Precomputed per-data-version structures for the library filter path.
+
+    Rebuilt only when the data version changes: lowercased search haystacks,
+    a token -> prompt-id inverted index, and (category, tag) -> prompt-id
+    posting lists so the per-rerun filter loop allocates nothing.
+    """
+    prompts = cached_get_all(version)
+
+    haystacks: Dict[str, str] = {}
+    token_index: Dict[str, set] = defaultdict(set)
+    tag_postings: Dict[tuple, set] = defaultdict(set)
+    for prompt in prompts:
+        hay = " ".join(getattr(prompt, f) for f in _SEARCH_FIELDS).lower()
+        haystacks[prompt.id] = hay
+        for token in _TOKEN_RE.split(hay):
+            if token:
+                token_index[token].add(prompt.id)
+        for category, names in prompt.tags.items():
+            for name in names:
+                tag_postings[(category, name)].add(prompt.id)
+
+    # Presorted id lists, one per sort option: the page filters within a
+    # presorted order instead of re-sorting on every rerun
+    title_asc = [p.id for p in sorted(prompts, key=lambda p: p.title.lower())]
+    sort_orders = {
+        "Title (A-Z)": title_asc,
+        "Title (Z-A)": list(reversed(title_asc)),
+        "Newest": [p.id for p in sorted(prompts, key=lambda p: p.last_modified or "",
+                                        reverse=True)],
+        "Oldest": [p.id for p in sorted(prompts, key=lambda p: p.created_at or "")],
+    }
+
+    return {
+        'haystacks': haystacks,
+        'token_index': dict(token_index),
+        'tag_postings': dict(tag_postings),
+        'sort_orders': sort_orders,
+    }
+
+
+def _search_candidates(query: str, version: int) -> set:
+    """Return the ids of prompts matching the query via the inverted index.
+
+    Query tokens prefix-match index tokens to collect candidates; candidates
+    are then verified by requiring every token as a substring of the full
+    haystack, so multi-word queries match with AND semantics regardless of
+    word order or the fields the words fall in.
+    """
+    index = _library_index(version)
+    haystacks, token_index = index['haystacks'], index['token_index']
+    tokens = [t for t in _TOKEN_RE.split(query) if t]
+    candidates = None
+    for token in tokens:
+        posting = set()
+        for key, ids in token_index.items():
+            if key.startswith(token):
+                posting |= ids
+        candidates = posting if candidates is None else candidates & posting
+    if candidates is None:
+        candidates = set(haystacks)
+    return {
+        pid for pid in candidates
+        if all(t in haystacks[pid] for t in tokens)
+    }
+
+
 # =============================================================================
 # AUTHENTICATION
 # =============================================================================
@@ -836,7 +1130,14 @@ def check_login() -> bool:
         submitted = st.form_submit_button("Log In", use_container_width=True, type="primary")
         
         if submitted:
-            if username == AUTH_USERNAME and password == AUTH_PASSWORD:
+            user_ok = hmac.compare_digest(
+                hashlib.sha256(username.encode()).digest(), _AUTH_USER_HASH
+            )
+            pass_ok = hmac.compare_digest(
+                hashlib.sha256(password.encode()).digest(), _AUTH_PASS_HASH
+            )
+            # Bitwise & avoids short-circuiting on the first mismatch
+            if user_ok & pass_ok:
                 st.session_state['logged_in'] = True
                 logger.info(f"User logged in: {username}")
                 st.rerun()
@@ -872,15 +1173,13 @@ def render_sidebar():
         
         # Export/Import section
         with st.expander("📦 Import / Export"):
-            if st.button("📥 Export All Prompts", use_container_width=True):
-                export_data = PromptRepository.export_all()
-                st.download_button(
-                    label="⬇️ Download JSON",
-                    data=export_data,
-                    file_name=f"prompts_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                    mime="application/json",
-                    use_container_width=True
-                )
+            st.download_button(
+                label="📥 Export All Prompts",
+                data=cached_export_bytes(_data_version()),
+                file_name=f"prompts_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                mime="application/json",
+                use_container_width=True
+            )
             
             uploaded_file = st.file_uploader(
                 "📤 Import from JSON",
@@ -890,7 +1189,7 @@ def render_sidebar():
             if uploaded_file and st.button("Import", use_container_width=True):
                 try:
                     content = uploaded_file.read().decode('utf-8')
-                    count = PromptRepository.import_from_json(content)
+                    count = import_prompts(content)
                     st.success(f"✅ Imported {count} prompts!")
                     st.rerun()
                 except Exception as e:
@@ -913,207 +1212,331 @@ def render_sidebar():
             st.image(str(image_path), use_container_width=True)
 
 
+# Number of prompt cards rendered per library page; each card ships several
+# widgets to the frontend, so rendering every match does not scale
+PAGE_SIZE = 25
+
+
+# Category groups for the tag filter panel
+_TAG_FILTER_GROUPS = {
+    "Task & Domain": ["Task Type", "Domain", "Function", "Use Case"],
+    "Technique & Format": ["Prompt Technique", "Prompt Structure", "Input Type", "Output Format", "Content Source"],
+    "Model & Platform": ["Model Family", "Model", "Platform", "Language"],
+    "Quality & Management": ["Tone", "Audience", "Complexity", "Abstraction Level", "Safety & Guardrails", "Quality Attributes", "Status"],
+}
+
+
 def render_tag_filters(all_tags_by_cat: Dict[str, List[str]]) -> Dict[str, List[str]]:
-    """Render tag filter UI and return selected tags."""
-    selected_tags = {}
-    
+    """Render tag filter UI and return selected tags.
+
+    Only the group picked in the radio ships its multiselects to the
+    frontend; the other groups' selections persist in session state, so
+    filters accumulate across group switches while each rerun builds a
+    quarter of the widgets the old four-tab layout did.
+    """
+    selections = st.session_state.setdefault('_tag_selections', {})
+
     with st.expander("🏷️ Advanced Tag Filtering", expanded=False):
-        # Group categories for better UX
-        tab_names = ["Task & Domain", "Technique & Format", "Model & Platform", "Quality & Management"]
-        tabs = st.tabs(tab_names)
-        
-        category_groups = {
-            "Task & Domain": ["Task Type", "Domain", "Function", "Use Case"],
-            "Technique & Format": ["Prompt Technique", "Prompt Structure", "Input Type", "Output Format", "Content Source"],
-            "Model & Platform": ["Model Family", "Model", "Platform", "Language"],
-            "Quality & Management": ["Tone", "Audience", "Complexity", "Abstraction Level", "Safety & Guardrails", "Quality Attributes", "Status"],
-        }
-        
-        for tab, (group_name, categories) in zip(tabs, category_groups.items()):
-            with tab:
-                cols = st.columns(2)
-                for i, cat_name in enumerate(categories):
-                    if cat_name in all_tags_by_cat:
-                        with cols[i % 2]:
-                            options = all_tags_by_cat.get(cat_name, [])
-                            selected_tags[cat_name] = st.multiselect(
-                                f"{cat_name}:",
-                                options=options,
-                                key=f"filter_{cat_name}"
-                            )
-    
-    return selected_tags
+        group_name = st.radio(
+            "Tag group",
+            list(_TAG_FILTER_GROUPS),
+            horizontal=True,
+            key="tag_filter_group",
+            label_visibility="collapsed"
+        )
+        cols = st.columns(2)
+        for i, cat_name in enumerate(_TAG_FILTER_GROUPS[group_name]):
+            if cat_name in all_tags_by_cat:
+                with cols[i % 2]:
+                    options = all_tags_by_cat.get(cat_name, [])
+                    # Reseed from the persistent selections: the widget's own
+                    # state is cleaned up while its group is hidden
+                    selections[cat_name] = st.multiselect(
+                        f"{cat_name}:",
+                        options=options,
+                        default=[t for t in selections.get(cat_name, []) if t in options],
+                        key=f"filter_{cat_name}"
+                    )
+
+    return selections
+
+
+# Shared card CSS, shipped once per rerun; badges reference the class instead
+# of repeating the inline style in every span of every card
+_TAG_BADGE_CSS = (
+    "<style>"
+    ".tag-badge{background-color:#2a3a57;color:#fff;padding:2px 8px;"
+    "border-radius:12px;margin-right:4px;font-size:.85em}"
+    ".tag-row{margin-bottom:8px}"
+    "</style>"
+)
+
+
+def _inject_styles() -> None:
+    """Emit the shared stylesheet (one small element per rerun)."""
+    st.markdown(_TAG_BADGE_CSS, unsafe_allow_html=True)
+
+
+@st.cache_data(show_spinner=False)
+def _render_tags_html(prompt_id: str, tags_key: tuple) -> str:
+    """Build a card's tag-badge HTML, memoized on the prompt's tag contents."""
+    tags_html = ""
+    for category, tags in tags_key:
+        if tags:
+            tag_spans = " ".join(
+                f"<span class='tag-badge'>{tag}</span>" for tag in tags
+            )
+            tags_html += f"<div class='tag-row'><b>{category}:</b> {tag_spans}</div>"
+    return tags_html
 
 
 def render_prompt_card(prompt: Prompt):
-    """Render a single prompt card in the library view."""
+    """Render a single prompt card in the library view.
+
+    Only the summary row is built for collapsed cards; the body (copy
+    widget, tags, action buttons) is rendered on demand, keeping the number
+    of widgets shipped per rerun proportional to the open cards rather than
+    the whole page.
+    """
     fav_icon = "🔱" if prompt.is_favorite == 1 else "☆"
     type_badge = prompt.prompt_type.capitalize()
-    
-    with st.expander(f"**{fav_icon} {prompt.title}** `[{type_badge}]`"):
+
+    open_cards = st.session_state.setdefault('_open_cards', set())
+    is_open = prompt.id in open_cards
+    keys = prompt.widget_keys
+
+    header_col, toggle_col = st.columns([5, 1])
+    with header_col:
+        st.markdown(f"**{fav_icon} {prompt.title}** `[{type_badge}]`")
+    with toggle_col:
+        label = "➖ Hide" if is_open else "➕ Details"
+        if st.button(label, key=keys['open'], use_container_width=True):
+            if is_open:
+                open_cards.discard(prompt.id)
+            else:
+                open_cards.add(prompt.id)
+            st.rerun(scope="fragment")
+
+    if not is_open:
+        return
+
+    with st.container(border=True):
         # Copy button
-        copy_text = prompt.get_copy_text()
-        
+        copy_text = prompt.copy_text
+
         if HAS_CLIPBOARD:
             st_copy_to_clipboard(
                 copy_text,
                 "📋 Copy Prompt",
                 "✅ Copied!",
-                key=f"copy_{prompt.id}"
+                key=keys['copy']
             )
         else:
-            if st.button("📋 Copy to Clipboard", key=f"copy_btn_{prompt.id}"):
+            if st.button("📋 Copy to Clipboard", key=keys['copy_btn']):
                 st.code(copy_text, language=None)
                 st.info("Select and copy the text above")
-        
+
         # Description
         if prompt.description:
             st.markdown(f"**Description:** *{prompt.description}*")
-        
+
         # Use case
         if prompt.use_case:
             st.markdown(f"**Use Case:** {prompt.use_case}")
-        
-        # Tags display
+
+        # Tags display (HTML fragment memoized per prompt + tag contents)
         if prompt.tags:
-            tags_html = ""
-            for category, tags in prompt.tags.items():
-                if tags:
-                    tag_spans = " ".join(
-                        f"<span style='background-color:#2a3a57; color:white; "
-                        f"padding: 2px 8px; border-radius: 12px; margin-right: 4px; "
-                        f"font-size: 0.85em;'>{tag}</span>"
-                        for tag in tags
-                    )
-                    tags_html += f"<div style='margin-bottom: 8px;'><b>{category}:</b> {tag_spans}</div>"
-            st.markdown(tags_html, unsafe_allow_html=True)
-        
+            tags_key = tuple(sorted((c, tuple(ts)) for c, ts in prompt.tags.items()))
+            st.markdown(_render_tags_html(prompt.id, tags_key), unsafe_allow_html=True)
+
         # Action buttons
         st.markdown("---")
         col1, col2, col3, col4, col5 = st.columns([1.2, 1, 1, 1, 3])
-        
+
         with col1:
-            if st.button(f"{'★' if prompt.is_favorite else '☆'} Favorite", key=f"fav_{prompt.id}"):
-                PromptRepository.toggle_favorite(prompt.id, prompt.is_favorite)
+            if st.button(f"{'★' if prompt.is_favorite else '☆'} Favorite", key=keys['fav']):
+                toggle_favorite(prompt.id, prompt.is_favorite)
                 st.rerun()
-        
+
         with col2:
-            if st.button("✏️ Edit", key=f"edit_{prompt.id}"):
+            if st.button("✏️ Edit", key=keys['edit']):
                 st.session_state.page = 'edit'
                 st.session_state.selected_prompt_id = prompt.id
                 st.rerun()
-        
+
         with col3:
-            if st.button("📑 Duplicate", key=f"dup_{prompt.id}"):
-                new_id = PromptRepository.duplicate(prompt.id)
+            if st.button("📑 Duplicate", key=keys['dup']):
+                new_id = duplicate_prompt(prompt.id)
                 if new_id:
                     st.success(f"Duplicated: {prompt.title}")
                     st.rerun()
-        
+
         with col4:
-            # Delete with confirmation
-            if f"confirm_delete_{prompt.id}" not in st.session_state:
-                st.session_state[f"confirm_delete_{prompt.id}"] = False
-            
-            if st.session_state[f"confirm_delete_{prompt.id}"]:
-                if st.button("⚠️ Confirm", key=f"confirm_{prompt.id}", type="primary"):
-                    PromptRepository.delete(prompt.id)
-                    st.session_state[f"confirm_delete_{prompt.id}"] = False
+            # Delete with confirmation: one shared set instead of a session
+            # key per prompt, keeping session state small
+            confirm_delete = st.session_state.setdefault('_confirm_delete', set())
+            if prompt.id in confirm_delete:
+                if st.button("⚠️ Confirm", key=keys['confirm'], type="primary"):
+                    delete_prompt(prompt.id)
+                    confirm_delete.discard(prompt.id)
                     st.success(f"Deleted: {prompt.title}")
                     st.rerun()
             else:
-                if st.button("🗑️ Delete", key=f"delete_{prompt.id}"):
-                    st.session_state[f"confirm_delete_{prompt.id}"] = True
+                if st.button("🗑️ Delete", key=keys['delete']):
+                    confirm_delete.add(prompt.id)
                     st.rerun()
 
 
-def render_library_page():
-    """Render the main library browsing page."""
-    st.title("💎 Prompt Library Database 💎")
-    
-    # Load data
-    all_prompts = PromptRepository.get_all()
-    all_tags_by_cat = get_all_tags_by_category()
-    
-    # Search and filters
+@st.fragment
+def _render_search_and_results():
+    """Filter form, tag panel and result cards, scoped as a fragment.
+
+    Widget interactions in here — Apply, the tag-group radio, card buttons,
+    pagination — rerun only this block; the sidebar, auth path and page
+    chrome outside it are skipped entirely.
+    """
+    # Load data (cached until the next mutation bumps the data version)
+    all_prompts = cached_get_all(_data_version())
+    all_tags_by_cat = st.session_state['tags_by_category']
+
+    # Search and filters live in one form, so editing several widgets costs
+    # a single rerun when the user hits Apply instead of one rerun each
     st.subheader("🔍 Find Prompts")
-    
-    col1, col2, col3 = st.columns([3, 1, 1])
-    with col1:
-        search_query = st.text_input(
-            "Search",
-            key="search_bar",
-            label_visibility="collapsed",
-            placeholder="🔍 Search by title, description, use case, content..."
-        )
-    with col2:
-        show_favorites = st.toggle("🔱 Favorites Only", key="favorites_toggle")
-    with col3:
-        sort_option = st.selectbox(
-            "Sort by",
-            ["Title (A-Z)", "Title (Z-A)", "Newest", "Oldest"],
-            key="sort_option",
-            label_visibility="collapsed"
-        )
-    
-    # Tag filters
+
+    with st.form("filters"):
+        col1, col2, col3 = st.columns([3, 1, 1])
+        with col1:
+            search_query = st.text_input(
+                "Search",
+                key="search_bar",
+                label_visibility="collapsed",
+                placeholder="🔍 Search by title, description, use case, content..."
+            )
+        with col2:
+            show_favorites = st.toggle("🔱 Favorites Only", key="favorites_toggle")
+        with col3:
+            sort_option = st.selectbox(
+                "Sort by",
+                ["Title (A-Z)", "Title (Z-A)", "Newest", "Oldest"],
+                key="sort_option",
+                label_visibility="collapsed"
+            )
+        submitted = st.form_submit_button("Apply Filters", use_container_width=True)
+
+    # The tag panel sits outside the form: its group-selector radio needs to
+    # rerun on change to swap the visible group, which form widgets cannot.
+    # Selections still only take effect on Apply via the snapshot below.
     selected_tags = render_tag_filters(all_tags_by_cat)
-    
-    # Apply filters
-    filtered_prompts = all_prompts
-    
-    # Favorites filter
+
+    # Filtering runs off the last-applied values; edits inside the form take
+    # effect only on submit
+    if submitted or '_applied_filters' not in st.session_state:
+        st.session_state['_applied_filters'] = {
+            'search': search_query,
+            'favorites': show_favorites,
+            'sort': sort_option,
+            # Copied, not referenced: selected_tags is the persistent
+            # session dict the panel mutates in place on every rerun
+            'tags': {cat: list(tags) for cat, tags in selected_tags.items()},
+        }
+    applied = st.session_state['_applied_filters']
+    search_query = applied['search']
+    show_favorites = applied['favorites']
+    sort_option = applied['sort']
+    selected_tags = applied['tags']
+
+    # Build the active filter predicates once, then filter in a single pass
+    # instead of materializing an intermediate list per filter
+    preds = []
+
     if show_favorites:
-        filtered_prompts = [p for p in filtered_prompts if p.is_favorite == 1]
-    
-    # Tag filters
-    for category, tags in selected_tags.items():
-        if tags:
-            filtered_prompts = [
-                p for p in filtered_prompts
-                if p.tags and set(tags).issubset(set(p.tags.get(category, [])))
-            ]
-    
-    # Search filter
+        preds.append(lambda p: p.is_favorite == 1)
+
+    # Tag filter: intersect the prebuilt (category, tag) posting lists, so
+    # the cost scales with the matching prompts rather than the library
+    active_tags = [(cat, t) for cat, tags in selected_tags.items() for t in tags]
+    if active_tags:
+        tag_postings = _library_index(_data_version())['tag_postings']
+        empty = set()
+        tag_ids = None
+        for pair in active_tags:
+            posting = tag_postings.get(pair, empty)
+            tag_ids = set(posting) if tag_ids is None else tag_ids & posting
+            if not tag_ids:
+                break
+        preds.append(lambda p: p.id in tag_ids)
+
+    # Search filter (inverted index + haystack verification)
     if search_query:
-        query = search_query.lower()
-        filtered_prompts = [
-            p for p in filtered_prompts
-            if query in p.title.lower()
-            or query in p.use_case.lower()
-            or query in p.description.lower()
-            or query in p.instructions.lower()
-            or query in p.task.lower()
-            or query in p.persona.lower()
-            or query in p.context.lower()
-        ]
-    
-    # Sort
-    if sort_option == "Title (A-Z)":
-        filtered_prompts.sort(key=lambda p: p.title.lower())
-    elif sort_option == "Title (Z-A)":
-        filtered_prompts.sort(key=lambda p: p.title.lower(), reverse=True)
-    elif sort_option == "Newest":
-        filtered_prompts.sort(key=lambda p: p.last_modified or "", reverse=True)
-    elif sort_option == "Oldest":
-        filtered_prompts.sort(key=lambda p: p.created_at or "")
+        matching_ids = _search_candidates(search_query.lower(), _data_version())
+        preds.append(lambda p: p.id in matching_ids)
+
+    # Filter within the presorted order for the selected sort option, so no
+    # sort (or per-comparison key computation) runs on the rerun path
+    sort_orders = _library_index(_data_version())['sort_orders']
+    prompts_by_id = {p.id: p for p in all_prompts}
+    ordered = (prompts_by_id[pid] for pid in sort_orders[sort_option])
+    if preds:
+        filtered_prompts = [p for p in ordered if all(pred(p) for pred in preds)]
+    else:
+        filtered_prompts = list(ordered)
     
-    # Results
+    # Pagination: reset to the first page whenever the filters change
+    st.session_state.setdefault('page_num', 0)
+    filter_state = hash((
+        search_query, show_favorites,
+        tuple(sorted((cat, tuple(tags)) for cat, tags in selected_tags.items() if tags)),
+    ))
+    if st.session_state.get('_filter_state') != filter_state:
+        st.session_state['_filter_state'] = filter_state
+        st.session_state.page_num = 0
+
+    total_pages = max(1, -(-len(filtered_prompts) // PAGE_SIZE))
+    page_num = min(st.session_state.page_num, total_pages - 1)
+    st.session_state.page_num = page_num
+
+    # Results (only the current page's cards are constructed)
     st.markdown("---")
     st.subheader(f"📋 Results ({len(filtered_prompts)})")
-    
+
     if not filtered_prompts:
         st.warning("No prompts found. Try adjusting your search or filters!")
     else:
-        for prompt in filtered_prompts:
+        start = page_num * PAGE_SIZE
+        for prompt in filtered_prompts[start:start + PAGE_SIZE]:
             render_prompt_card(prompt)
 
+        if total_pages > 1:
+            col_prev, col_info, col_next = st.columns([1, 2, 1])
+            with col_prev:
+                if st.button("⬅️ Previous", disabled=page_num == 0,
+                             use_container_width=True):
+                    st.session_state.page_num -= 1
+                    st.rerun(scope="fragment")
+            with col_info:
+                st.markdown(
+                    f"<div style='text-align:center'>Page {page_num + 1} of {total_pages}</div>",
+                    unsafe_allow_html=True
+                )
+            with col_next:
+                if st.button("Next ➡️", disabled=page_num >= total_pages - 1,
+                             use_container_width=True):
+                    st.session_state.page_num += 1
+                    st.rerun(scope="fragment")
+
+
+def render_library_page():
+    """Render the main library browsing page."""
+    st.title("💎 Prompt Library Database 💎")
+    _inject_styles()
+    _render_search_and_results()
+
 
 def render_edit_page():
     """Render the add/edit prompt page."""
     prompt_to_edit = None
     if st.session_state.selected_prompt_id:
-        prompt_to_edit = PromptRepository.get_by_id(st.session_state.selected_prompt_id)
+        prompt_to_edit = get_prompt(st.session_state.selected_prompt_id)
     
     if prompt_to_edit:
         st.title(f"✏️ Edit Prompt: `{prompt_to_edit.title}`")
@@ -1242,7 +1665,7 @@ def render_edit_page():
         # Tags
         st.subheader("🏷️ Tags")
         
-        all_tags_by_cat = get_all_tags_by_category()
+        all_tags_by_cat = st.session_state['tags_by_category']
         tags_data = {}
         
         # Group tags into tabs for better organization
@@ -1262,10 +1685,16 @@ def render_edit_page():
                 for i, cat in enumerate(categories):
                     if cat in all_tags_by_cat:
                         with cols[i % 2]:
+                            # Imported prompts can carry tags outside the
+                            # option list (e.g. free-form Complexity values);
+                            # a default missing from options raises, so drop
+                            # unknowns instead of bricking the edit page
+                            options = all_tags_by_cat[cat]
                             tags_data[cat] = st.multiselect(
                                 cat,
-                                options=all_tags_by_cat[cat],
-                                default=defaults['tags'].get(cat, []),
+                                options=options,
+                                default=[t for t in defaults['tags'].get(cat, [])
+                                         if t in options],
                                 key=f"tag_{cat}"
                             )
         
@@ -1303,7 +1732,7 @@ def render_edit_page():
                 )
                 
                 # Save
-                PromptRepository.save(prompt, tags_data)
+                save_prompt(prompt, tags_data)
                 st.success(f"✅ Prompt saved: {title}")
                 
                 # Return to library
@@ -1318,13 +1747,17 @@ def render_edit_page():
 
 def main():
     """Main application entry point."""
-    # Initialize database
-    init_db()
-    
-    # Check authentication
+    # Check authentication first so unauthenticated hits never touch the DB
     if not check_login():
         return
-    
+
+    # Initialize database (cached: the DDL runs once per server process)
+    _ensure_db()
+
+    # Tag inventory fetched once per rerun; both pages read this instead of
+    # resolving the cache independently
+    st.session_state['tags_by_category'] = cached_tags_by_category(_data_version())
+
     # Initialize session state
     if 'page' not in st.session_state:
         st.session_state.page = 'library'